@@ -101,12 +101,26 @@ if __name__ == "__main__":
     env_manager.setup_environment()
 
     from scraping.linkedin import LinkedInCrawler
+    from tools.throttle_manager import ThrottleController
+    from tools.retention_manager import RetentionManager
 
     os.environ['SESSION_UID'] = uuid.uuid4().hex
     crawler = LinkedInCrawler(browser="chrome", user_id=1)
+    retention = RetentionManager(crawler.db_manager)
     while True:
+        try:
+            retention.run_if_due()
+        except Exception as e:
+            env_manager.logger.error(f"Database retention failed: {e}")
+
         try:
             crawler.search_jobs(location="Brasil")
+            crawler.fetch_job_details(limit=100)
         except Exception as e:
-            print(e)
+            action = crawler.throttle.record_failure(e)
+            if action == ThrottleController.RECREATE_DRIVER:
+                try:
+                    crawler.restart_browser()
+                except Exception as restart_error:
+                    crawler.throttle.record_failure(restart_error)
             continue
@@ -2,6 +2,8 @@ import os
 import re
 import sys
 import time
+from collections import deque
+from datetime import datetime
 
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
@@ -15,7 +17,12 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'src',))
 from tools.browser_manager import BrowserManager
 from tools.logging_manager import LoggingManager
 from tools.database_manager import DatabaseManager
+from tools.dimension_normalizer import DimensionNormalizer
+from tools.throttle_manager import RateLimitError, ThrottleController
+from tools.retention_manager import existing_urls
+from tools.profiling_manager import profiled
 from utils import orm_base
+from utils.text_parsing import parse_job_details, parse_location
 
 scroll_script = """
     var div = document.querySelector('.jobs-search-results-list');
@@ -29,6 +36,31 @@ scroll_script = """
     }, 5);
 """
 
+rate_limit_markers = ("/checkpoint/", "/authwall", "/uas/login")
+
+# Returns null while the job page is loading (the previous document still carries the
+# pending marker set when the navigation started), otherwise an object with a status:
+# "ok" with the page texts, "missing" if the description could not be found, or
+# "redirected" if the page loaded at another path (e.g. a removed posting)
+job_details_script = """
+    var target = arguments[0];
+    if (window.jobDetailsPending || document.readyState !== 'complete') {
+        return null;
+    }
+    if (location.pathname.replace(/\\/$/, '') !== target) {
+        return {status: 'redirected', url: location.href};
+    }
+    var description = document.querySelector('#job-details, .jobs-description__content, .show-more-less-html__markup');
+    if (!description) {
+        return {status: 'missing'};
+    }
+    var topCard = document.querySelector('.job-details-jobs-unified-top-card__primary-description-container, .jobs-unified-top-card, .top-card-layout');
+    var insights = Array.from(
+        document.querySelectorAll('.job-details-jobs-unified-top-card__job-insight, .description__job-criteria-item')
+    ).map(function(element) { return element.innerText; });
+    return {status: 'ok', description: description.innerText, top_card: topCard ? topCard.innerText : '', insights: insights};
+"""
+
 class Login:
     def __init__(self, user_id):
         self._get_user_data(user_id)
@@ -126,17 +158,50 @@ class Login:
             self.logger.warning("Timeout waiting for page to load completely.")
 
 class LinkedInCrawler(Login):
-    def __init__(self, user_id, browser="chrome", headless=False):
+    def __init__(self, user_id, browser="chrome", headless=False, incremental=False, max_known_pages=2, capture_snapshots=False,
+                 extraction="dom", payload_record_dir=None):
+        """
+        Args:
+        incremental: stop paginating once `max_known_pages` consecutive pages
+            contain only jobs that are already stored in the database.
+        max_known_pages: number of consecutive fully-known pages tolerated in incremental mode.
+        capture_snapshots: store each results page source in the snapshot store for offline re-extraction.
+            Only available with the "dom" extraction, since the page is not hydrated in network mode.
+        extraction: "dom" to read the rendered job cards, or "network" (Chrome only) to decode the
+            job postings from LinkedIn's internal API responses captured through the performance log.
+            The cards are not scrolled into view in network mode, so they are not closed either and
+            each search walks every page again; combine it with `incremental` to stop at the frontier.
+        payload_record_dir: directory where captured API responses are saved as fixtures, in network mode.
+        """
         self.logger = LoggingManager(logger_name='LinkedInCrawler').get_logger()
-        self.browser_manager = BrowserManager(browser=browser, headless=headless)
+        if extraction not in ("dom", "network"):
+            raise ValueError(f"Extraction mode '{extraction}' not supported. Supported modes: dom, network")
+        if capture_snapshots and extraction == "network":
+            raise ValueError("Snapshots need the hydrated DOM, use payload_record_dir to keep the network responses instead.")
+        self.extraction = extraction
+        self.payload_record_dir = payload_record_dir
+        self.browser_manager = BrowserManager(browser=browser, headless=headless, capture_network=extraction == "network")
         self.driver = self.browser_manager.driver
         self.db_manager = DatabaseManager()
+        self.normalizer = DimensionNormalizer(self.db_manager)
+        self.throttle = ThrottleController.for_account("LinkedIn", user_id)
+        self.snapshot_store = None
+        if capture_snapshots:
+            from tools.snapshot_store import SnapshotStore
+            self.snapshot_store = SnapshotStore(self.db_manager)
 
         super().__init__(user_id)
 
         self.search_count = 0
         self.user_wants_to_stop = False
 
+        self.incremental = incremental
+        self.max_known_pages = max_known_pages
+        self.known_pages_streak = 0
+        self.frontier_depth = 0
+        self.frontier_history = []
+
+    @profiled
     def search_jobs(self, location=None, keywords=None):
         print(self.search_count)
         """
@@ -148,10 +213,22 @@ class LinkedInCrawler(Login):
         if location:
             url += f"location={location}&"
 
+        self.search_url = url
         while True:
             self.search_count += 1
+            self.known_pages_streak = 0
+            self.frontier_depth = 0
+            self.throttle.wait()
+            self.navigation_started = time.monotonic()
             self.driver.get(url)
             self._get_job_data()
+            self.frontier_history.append({
+                'search': self.search_count,
+                'url': url,
+                'frontier_depth': self.frontier_depth,
+                'finished_at': datetime.utcnow(),
+            })
+            self.logger.info(f"Search: {self.search_count} reached frontier depth {self.frontier_depth}.")
             if self.user_wants_to_stop:
                 self.logger.info("All jobs collected. Stopping search.")
                 break
@@ -164,7 +241,7 @@ class LinkedInCrawler(Login):
         Collect data from all job cards on the page.
         """
         while True:
-            time.sleep(3)
+            self._check_rate_limit()
             try:
                 current_page_button = self.driver.find_element(By.CSS_SELECTOR ,"li.artdeco-pagination__indicator--number.active.selected")
                 self.current_page_number = int(current_page_button.text)
@@ -172,27 +249,253 @@ class LinkedInCrawler(Login):
                 self.logger.error("The current page could not be found.")
                 return False
 
+            network_mode = self.extraction == "network"
+            job_cards = self._load_job_cards(scroll=not network_mode)
+            self.throttle.record_success(time.monotonic() - self.navigation_started)
+            if self.snapshot_store:
+                self._capture_snapshot()
+
+            collected = self._collect_network_data() if network_mode else []
+            if network_mode and len(collected) < len(job_cards):
+                # Responses whose body could not be read are dropped, so a partial capture is read from the DOM
+                self.logger.warning(f"Search: {self.search_count} Page: {self.current_page_number}. Decoded {len(collected)} job postings from the network for {len(job_cards)} cards, falling back to the DOM.")
+                collected = []
+                job_cards = self._load_job_cards(scroll=True)
+
+            card_count = len(job_cards)
+            closed_cards = 0
+            if not collected:
+                for index, card in enumerate(job_cards):
+                    if self._is_card_closed(card):
+                        closed_cards += 1
+                        continue
+                    job_data = self._collect_card_data(index, card)
+                    if job_data:
+                        collected.append((index, card, job_data))
+
+            known_urls = self._existing_urls([job_data['url'] for _, _, job_data in collected])
+            for index, card, job_data in collected:
+                if job_data['url'] not in known_urls:
+                    if self._insert_job_data(job_data) and card:
+                        self._close_job_card(card, index)
+                elif card:
+                    self.logger.warning(f"Search: {self.search_count} Page: {self.current_page_number} Card: {index+1}. Vacancy previously collected, called the close vacancy.")
+                    self._close_job_card(card, index)
+
+            self.frontier_depth = self.current_page_number
+            if self._is_known_frontier(collected, known_urls, closed_cards, card_count):
+                break
+
+            if not self._navigate_to_next_page():
+                break
+
+    def _capture_snapshot(self):
+        """Saves the current results page source in the snapshot store."""
+        try:
+            self.snapshot_store.save(self.driver.page_source, "LinkedIn", self.search_url, self.current_page_number)
+        except Exception as e:
+            self.logger.error(f"Search: {self.search_count} Page: {self.current_page_number}. Failed to capture snapshot: {e}")
+
+    def fetch_job_details(self, tabs=4, batch_size=20, limit=None, page_timeout=30, max_attempts=3):
+        """
+        Loads the detail page of the jobs whose details were not fetched yet in a pool of
+        tabs and stores their description, seniority and applicant count.
+
+        Navigations are started without waiting for the load, so up to `tabs`
+        pages are in flight at once; each tab is polled until its page is ready.
+        Checkpoint/authwall redirects raise RateLimitError and timeouts are reported
+        to the throttle, which may stop the stage and recreate the driver. Pages that
+        load without a description (changed markup, removed or redirected postings)
+        are logged as extraction misses. Every attempt is counted, and jobs are left
+        out of the queue after `max_attempts` attempts.
+
+        Returns:
+        The number of jobs updated.
+        """
+        queue = deque(self._pending_detail_jobs(limit, max_attempts))
+        if not queue:
+            self.logger.info("No jobs pending detail fetch.")
+            return 0
+
+        self.logger.info(f"Fetching details of {len(queue)} jobs with {tabs} tabs.")
+        main_handle = self.driver.current_window_handle
+        handles = []
+        in_flight = {}
+        updates = []
+        updated = 0
+        circuit_action = None
+        try:
+            for _ in range(tabs):
+                self.driver.switch_to.new_window('tab')
+                handles.append(self.driver.current_window_handle)
+
+            while (queue or in_flight) and circuit_action is None:
+                for handle in handles:
+                    if handle not in in_flight and queue:
+                        job_id, url, attempts = queue.popleft()
+                        self.throttle.wait()
+                        self.driver.switch_to.window(handle)
+                        self.driver.execute_script(
+                            "window.jobDetailsPending = true; window.location.href = arguments[0];", url
+                        )
+                        in_flight[handle] = (job_id, url, attempts + 1, time.monotonic())
+
+                for handle, (job_id, url, attempts, started) in list(in_flight.items()):
+                    self.driver.switch_to.window(handle)
+                    self._check_rate_limit()
+                    raw_details = self.driver.execute_script(job_details_script, url.split('linkedin.com')[-1].rstrip('/'))
+                    elapsed = time.monotonic() - started
+                    if raw_details is None:
+                        if elapsed > page_timeout:
+                            del in_flight[handle]
+                            updates.append({'id': job_id, 'details_attempts': attempts})
+                            action = self.throttle.record_failure(TimeoutException(f"Timeout loading job details from {url}"))
+                            if action != ThrottleController.RETRY:
+                                circuit_action = action
+                                break
+                        continue
+
+                    del in_flight[handle]
+                    self.throttle.record_success(elapsed)
+                    if raw_details['status'] == 'ok':
+                        updates.append({
+                            'id': job_id,
+                            **parse_job_details(raw_details),
+                            'details_attempts': attempts,
+                            'details_fetched_at': datetime.utcnow(),
+                        })
+                    else:
+                        self.logger.warning(
+                            f"Extraction miss ({raw_details['status']}) on job details of {url}, attempt {attempts}/{max_attempts}."
+                        )
+                        updates.append({'id': job_id, 'details_attempts': attempts})
+                    if len(updates) >= batch_size:
+                        updated += self._flush_job_details(updates)
+                        updates = []
+
+                time.sleep(0.2)
+        finally:
+            updated += self._flush_job_details(updates)
+            self._close_detail_tabs(handles, main_handle)
+
+        self.logger.info(f"Stored {updated} job detail attempts.")
+        if circuit_action == ThrottleController.RECREATE_DRIVER:
+            self.restart_browser()
+        return updated
+
+    def _flush_job_details(self, updates):
+        """Writes a batch of job details. Returns the number of jobs written."""
+        try:
+            self.db_manager.bulk_update(orm_base.JobsBaseInfo, updates)
+            return len(updates)
+        except Exception as e:
+            self.logger.error(f"Failed to store details of {len(updates)} jobs: {e}")
+            return 0
+
+    def _close_detail_tabs(self, handles, main_handle):
+        """Closes the detail tabs and switches back to the main tab, without raising."""
+        for handle in handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close detail tab: {e}")
+        try:
+            self.driver.switch_to.window(main_handle)
+        except Exception as e:
+            self.logger.warning(f"Failed to switch back to the main tab: {e}")
+
+    def _pending_detail_jobs(self, limit=None, max_attempts=3):
+        """Returns (id, url, attempts) of jobs whose details were not fetched yet and are still retried."""
+        JobsBaseInfo = orm_base.JobsBaseInfo
+        with self.db_manager.session_scope() as session:
+            query = session.query(JobsBaseInfo.id, JobsBaseInfo.url, JobsBaseInfo.details_attempts).filter(
+                JobsBaseInfo.platform == 'LinkedIn',
+                JobsBaseInfo.details_fetched_at.is_(None),
+                JobsBaseInfo.details_attempts < max_attempts,
+            ).order_by(JobsBaseInfo.registration_date.desc())
+            if limit:
+                query = query.limit(limit)
+            return [(row.id, row.url, row.details_attempts) for row in query.all()]
+
+    def _check_rate_limit(self):
+        """Raises RateLimitError if LinkedIn redirected to a checkpoint or authwall page."""
+        current_url = self.driver.current_url
+        if any(marker in current_url for marker in rate_limit_markers):
+            self.logger.warning(f"Search: {self.search_count}. Rate-limit page detected: {current_url}")
+            raise RateLimitError(f"LinkedIn redirected to {current_url}")
+
+    def _is_known_frontier(self, collected, known_urls, closed_cards, card_count):
+        """
+        Tracks consecutive pages whose URL set is entirely stored already.
+
+        A page only counts as known when every card on it was recognized, either as
+        a previously closed card or as a collected job whose URL is stored. Pages with
+        no cards or with cards that could not be read reset the streak, so a markup
+        change never ends the crawl early.
+
+        Returns:
+        True if incremental mode is on and the streak reached `max_known_pages`, False otherwise.
+        """
+        if not self.incremental:
+            return False
+
+        recognized = len(collected) + closed_cards
+        if not recognized or recognized < card_count:
+            self.logger.warning(f"Search: {self.search_count} Page: {self.current_page_number}. Only {recognized} of {card_count} cards recognized, not counting the page as known.")
+            self.known_pages_streak = 0
+            return False
+
+        page_urls = {job_data['url'] for _, _, job_data in collected}
+        if page_urls - known_urls:
+            self.known_pages_streak = 0
+            return False
+
+        self.known_pages_streak += 1
+        self.logger.info(f"Search: {self.search_count} Page: {self.current_page_number}. Page entirely known ({self.known_pages_streak}/{self.max_known_pages}).")
+        if self.known_pages_streak >= self.max_known_pages:
+            self.logger.info(f"Search: {self.search_count}. Stopping pagination at page {self.current_page_number}, no fresh jobs left.")
+            return True
+        return False
+
+    def _load_job_cards(self, scroll=True):
+        """
+        Waits for the job cards of the current page, scrolling the results list first to hydrate them.
+        """
+        if scroll:
             for _ in range(5):
                 elements = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-search-results__job-card-search--generic-occludable-area")
                 if not elements:
                     break
                 self.driver.execute_script(scroll_script)
 
-            job_cards = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.jobs-search-results__list-item"))
-            )
-            for index, card in enumerate(job_cards):
-                job_data = self._collect_card_data(index, card)
-                if job_data:
-                    if not self._url_exists(job_data['url']):
-                        if self._insert_job_data(job_data):
-                            self._close_job_card(card, index)
-                    else:
-                        self.logger.warning(f"Search: {self.search_count} Page: {self.current_page_number} Card: {index+1}. Vacancy previously collected, called the close vacancy.")
-                        self._close_job_card(card, index)
+        return WebDriverWait(self.driver, 10).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.jobs-search-results__list-item"))
+        )
 
-            if not self._navigate_to_next_page():
-                break
+    def _collect_network_data(self):
+        """
+        Decodes the job postings of the voyager responses captured since the last call.
+
+        Cards are not available in this mode, so entries are returned as (index, None, job_data).
+        """
+        from scraping.linkedin_voyager import JOB_CARDS_URL_FILTER, parse_voyager_jobs, record_voyager_payload
+
+        jobs = {}
+        for payload in self.browser_manager.get_network_responses(JOB_CARDS_URL_FILTER):
+            if self.payload_record_dir:
+                record_voyager_payload(payload, self.payload_record_dir, f"{self.search_count}_{self.current_page_number}_{len(jobs)}")
+            for job_data in parse_voyager_jobs(payload):
+                jobs.setdefault(job_data['url'], job_data)
+        return [(index, None, job_data) for index, job_data in enumerate(jobs.values())]
+
+    def _is_card_closed(self, card):
+        """
+        Checks if a job card was already closed (hidden) in a previous search.
+        """
+        action_button = card.find_element(By.XPATH, ".//button[contains(@class, 'job-card-container__action')]")
+        action_button = action_button.find_element(By.XPATH, ".//*[name()='use']")
+        return action_button.get_attribute('href') != "#close-small"
 
     def _collect_card_data(self, index, card):
         """
@@ -200,20 +503,11 @@ class LinkedInCrawler(Login):
         """
         self.driver.execute_script("arguments[0].scrollIntoView();", card)
 
-        action_button = card.find_element(By.XPATH, ".//button[contains(@class, 'job-card-container__action')]")
-        action_button = action_button.find_element(By.XPATH, ".//*[name()='use']")
-        if action_button.get_attribute('href') != "#close-small":
-            return None
-
         try:
             title_element = card.find_element(By.XPATH, ".//a[contains(@class, 'job-card-list__title')]")
-            location_element = card.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text.split("(")
-            if len(location_element) > 1:
-                location = location_element[0].strip()
-                work_format = location_element[1].rstrip(")")
-            else:
-                location = location_element[0]
-                work_format = 'N/A'
+            location, work_format = parse_location(
+                card.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
+            )
 
             return {
                 'platform': 'LinkedIn',
@@ -269,7 +563,10 @@ class LinkedInCrawler(Login):
             current_page_element = self.driver.find_element(By.CSS_SELECTOR, "li.artdeco-pagination__indicator--number.active.selected")
             next_page_element = current_page_element.find_element(By.XPATH, "following-sibling::li[1]/button")
             self.driver.execute_script("arguments[0].scrollIntoView();", next_page_element)
+            self.throttle.wait()
+            self.navigation_started = time.monotonic()
             self.driver.execute_script("arguments[0].click();", next_page_element)
+            self._wait_for_page(self.current_page_number + 1)
             return True
         except NoSuchElementException:
             self.logger.warning("There are no more pages to navigate or the next page is not directly accessible.")
@@ -278,21 +575,46 @@ class LinkedInCrawler(Login):
             self.logger.error(f"Failed to navigate to the next page: {e}", exc_info=True)
             return False
 
-    def _url_exists(self, url):
-        """Checks if the URL already exists in the database."""
+    def _wait_for_page(self, page_number):
+        """Waits until the pagination marks `page_number` as the active page."""
+        try:
+            WebDriverWait(self.driver, 10, ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)).until(
+                lambda driver: driver.find_element(By.CSS_SELECTOR, "li.artdeco-pagination__indicator--number.active.selected").text.strip() == str(page_number)
+            )
+        except TimeoutException:
+            self.logger.warning(f"Timeout waiting for page {page_number} to become active.")
+
+    def _existing_urls(self, urls):
+        """Returns the subset of URLs that already exist in the database, including the archives."""
         with self.db_manager.session_scope() as session:
-            exists = session.query(orm_base.JobsBaseInfo).filter(orm_base.JobsBaseInfo.url == url).first() is not None
-        return exists
+            return existing_urls(session, urls)
 
     def _insert_job_data(self, job_data):
         """Inserts job data into the database."""
         try:
-            self.db_manager.add_entry(orm_base.JobsBaseInfo(**job_data), orm_base.JobsBaseInfo)
+            job_row = self.normalizer.normalize_job(job_data)
+            self.db_manager.add_entry(orm_base.JobsBaseInfo(**job_row), orm_base.JobsBaseInfo)
             return True
         except Exception as e:
             self.logger.error(f"Failed to insert job data into the database: {e}")
             return False
 
+    def restart_browser(self):
+        """Recreates the webdriver and logs in again."""
+        self.logger.info("Recreating webdriver")
+        try:
+            self.browser_manager.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to close the previous webdriver: {e}")
+
+        self.browser_manager = BrowserManager(
+            browser=self.browser_manager.browser,
+            headless=self.browser_manager.headless,
+            capture_network=self.browser_manager.capture_network,
+        )
+        self.driver = self.browser_manager.driver
+        self.login()
+
     def close(self):
         """Closes the webdriver and saves cookies."""
         self.logger.info("Saving cookies and closing browser")
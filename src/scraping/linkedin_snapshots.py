@@ -0,0 +1,125 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # optional dependency, only needed for offline extraction
+    lxml_html = None
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from tools.logging_manager import LoggingManager
+from tools.database_manager import DatabaseManager
+from tools.dimension_normalizer import DimensionNormalizer
+from tools.snapshot_store import SnapshotStore
+from tools.retention_manager import existing_urls
+from utils import orm_base
+from utils.text_parsing import parse_location
+
+
+def _class_xpath(class_name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def extract_jobs_from_html(page_source):
+    """
+    Extracts job card data from a LinkedIn results page source.
+
+    Mirrors `LinkedInCrawler._collect_card_data`, including skipping cards that were already closed.
+    """
+    tree = lxml_html.fromstring(page_source)
+    jobs = []
+    for card in tree.xpath(f"//li[{_class_xpath('jobs-search-results__list-item')}]"):
+        icons = card.xpath(f".//button[contains(@class, 'job-card-container__action')]//*[local-name()='use']")
+        if not icons or (icons[0].get('href') or icons[0].get('xlink:href')) != "#close-small":
+            continue
+
+        titles = card.xpath(".//a[contains(@class, 'job-card-list__title')]")
+        companies = card.xpath(f".//*[{_class_xpath('job-card-container__primary-description')}]")
+        metadata = card.xpath(f".//*[{_class_xpath('job-card-container__metadata-item')}]")
+        if not titles or not companies or not metadata:
+            continue
+
+        strong = titles[0].xpath(".//strong")
+        location, work_format = parse_location(metadata[0].text_content().strip())
+        jobs.append({
+            'platform': 'LinkedIn',
+            'title': (strong[0] if strong else titles[0]).text_content().strip(),
+            'company': companies[0].text_content().strip(),
+            'location': location,
+            'work_format': work_format,
+            'url': urljoin("https://www.linkedin.com", titles[0].get('href', '')).split('?')[0],
+        })
+    return jobs
+
+
+def _extract_snapshot(path):
+    """Process pool worker: decompresses one snapshot blob and extracts its jobs."""
+    return extract_jobs_from_html(SnapshotStore.read_blob(path))
+
+
+class LinkedInSnapshotExtractor:
+    """Re-extracts job data from stored LinkedIn page snapshots, without a browser."""
+
+    def __init__(self, db_manager=None, root="data/snapshots", workers=None):
+        if lxml_html is None:
+            raise ImportError("Offline extraction requires the 'lxml' package.")
+        self.logger = LoggingManager(logger_name='LinkedInSnapshotExtractor').get_logger()
+        self.db_manager = db_manager or DatabaseManager()
+        self.snapshot_store = SnapshotStore(self.db_manager, root=root)
+        self.normalizer = DimensionNormalizer(self.db_manager)
+        self.workers = workers
+
+    def run(self, search=None, since=None):
+        """
+        Extracts every distinct snapshot matching the filters and inserts the new jobs.
+
+        Returns:
+        The number of inserted jobs.
+        """
+        paths = [self.snapshot_store.blob_path(content_hash) for content_hash in self._snapshot_hashes(search, since)]
+        paths = [path for path in paths if os.path.exists(path)]
+        self.logger.info(f"Extracting {len(paths)} snapshots")
+
+        jobs = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for page_jobs in executor.map(_extract_snapshot, paths, chunksize=16):
+                for job_data in page_jobs:
+                    jobs.setdefault(job_data['url'], job_data)
+
+        return self._insert_new_jobs(list(jobs.values()))
+
+    def _snapshot_hashes(self, search, since):
+        """Returns the distinct content hashes indexed for the given filters."""
+        PageSnapshot = orm_base.PageSnapshot
+        with self.db_manager.session_scope() as session:
+            query = session.query(PageSnapshot.content_hash).filter(PageSnapshot.platform == "LinkedIn")
+            if search:
+                query = query.filter(PageSnapshot.search == search)
+            if since:
+                query = query.filter(PageSnapshot.captured_at >= since)
+            return [row.content_hash for row in query.distinct()]
+
+    def _insert_new_jobs(self, jobs):
+        """Inserts the jobs whose URL is not stored yet."""
+        JobsBaseInfo = orm_base.JobsBaseInfo
+        urls = [job_data['url'] for job_data in jobs]
+        known_urls = set()
+        with self.db_manager.session_scope() as session:
+            for start in range(0, len(urls), 500):
+                known_urls.update(existing_urls(session, urls[start:start + 500]))
+
+        new_rows = [
+            JobsBaseInfo(**self.normalizer.normalize_job(job_data))
+            for job_data in jobs if job_data['url'] not in known_urls
+        ]
+        with self.db_manager.session_scope() as session:
+            session.add_all(new_rows)
+
+        self.logger.info(f"Inserted {len(new_rows)} of {len(jobs)} extracted jobs")
+        return len(new_rows)
+
+
+if __name__ == "__main__":
+    LinkedInSnapshotExtractor().run()
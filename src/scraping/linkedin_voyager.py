@@ -0,0 +1,67 @@
+import json
+import os
+import re
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.text_parsing import parse_location
+
+# Substring of the internal (voyager) API URLs that carry the job search results
+JOB_CARDS_URL_FILTER = "voyagerJobsDash"
+JOB_POSTING_CARD_TYPE = "com.linkedin.voyager.dash.jobs.JobPostingCard"
+
+job_id_pattern = re.compile(r"fsd_jobPosting(?:Card)?:\(?(\d+)")
+
+
+def _text(value):
+    """Returns the text of a voyager TextViewModel or a plain string."""
+    if isinstance(value, dict):
+        return (value.get("text") or "").strip()
+    return (value or "").strip()
+
+
+def parse_voyager_jobs(payload):
+    """
+    Decodes the job cards of a voyager job search response into job data dicts.
+
+    `payload` is the decoded JSON body, as returned by `BrowserManager.get_network_responses`
+    or loaded from a recorded fixture with `load_voyager_payload`.
+    """
+    included = payload.get("included") or (payload.get("data") or {}).get("included") or []
+    jobs = {}
+    for entity in included:
+        if entity.get("$type") != JOB_POSTING_CARD_TYPE:
+            continue
+
+        urn = entity.get("jobPostingUrn") or entity.get("*jobPosting") or entity.get("entityUrn") or ""
+        job_id = job_id_pattern.search(urn)
+        title = entity.get("jobPostingTitle") or _text(entity.get("title"))
+        if not job_id or not title:
+            continue
+
+        location, work_format = parse_location(_text(entity.get("secondaryDescription")))
+        url = f"https://www.linkedin.com/jobs/view/{job_id.group(1)}/"
+        jobs[url] = {
+            'platform': 'LinkedIn',
+            'title': title.strip(),
+            'company': _text(entity.get("primaryDescription")),
+            'location': location,
+            'work_format': work_format,
+            'url': url,
+        }
+    return list(jobs.values())
+
+
+def load_voyager_payload(path):
+    """Loads a recorded voyager response body."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record_voyager_payload(payload, directory, name):
+    """Saves a voyager response body so it can be replayed as a fixture."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    return path
@@ -1,5 +1,7 @@
 import sys
 import os
+import json
+import base64
 import pickle
 
 from selenium import webdriver
@@ -15,6 +17,7 @@ from webdriver_manager.opera import OperaDriverManager
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 from tools.logging_manager import LoggingManager
+from tools.profiling_manager import ProfilingManager
 
 # TODO add safari driver suporte
 
@@ -22,9 +25,10 @@ from tools.logging_manager import LoggingManager
 class BrowserManager:
     __BROWSERS = {"Chrome", "Edge", "Firefox", "Opera"}
 
-    def __init__(self, browser, headless=False):
+    def __init__(self, browser, headless=False, capture_network=False):
         self.browser = browser.capitalize()
         self.headless = headless
+        self.capture_network = capture_network
         self._driver = None
         self.options = None
         self.logger = LoggingManager(logger_name='BrowserManager').get_logger()
@@ -38,6 +42,9 @@ class BrowserManager:
             raise ValueError(
                 f"Browser '{self.browser}' not supported. Supported browsers: {', '.join(self.__BROWSERS)}"
             )
+        if self.capture_network and self.browser != "Chrome":
+            self.logger.error(f"Network capture is not supported for {self.browser}.")
+            raise ValueError("Network capture is only supported for Chrome.")
 
         service = self._get_service()
         options = self._get_options()
@@ -45,6 +52,7 @@ class BrowserManager:
             self._driver = getattr(webdriver, self.browser)(
                 service=service, options=options
             )
+            ProfilingManager.get().instrument_driver(self._driver)
             self.logger.info(f"Webdriver for {self.browser} created successfully")
         except Exception as e:
             self.logger.error(f"Error creating webdriver: {e}")
@@ -95,6 +103,9 @@ class BrowserManager:
         options.add_experimental_option("prefs", {"profile.default_content_setting_values.geolocation": 2})
         options.add_experimental_option("useAutomationExtension", False)
 
+        if self.capture_network:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
         if self.headless:
             options.add_argument("--headless")
             options.add_argument('--disable-gpu')
@@ -153,6 +164,33 @@ class BrowserManager:
             self.logger.error(f"Error injecting cookies from the database: {e}")
             return False
 
+    def get_network_responses(self, url_filter):
+        """
+        Drains the performance log and returns the JSON bodies of the responses
+        whose URL contains `url_filter`, in arrival order.
+        """
+        if not self.capture_network:
+            raise RuntimeError("Network capture is not enabled for this browser.")
+
+        responses = []
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") != "Network.responseReceived":
+                continue
+            params = message["params"]
+            if url_filter not in params["response"]["url"]:
+                continue
+
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+                content = body["body"]
+                if body.get("base64Encoded"):
+                    content = base64.b64decode(content).decode("utf-8")
+                responses.append(json.loads(content))
+            except Exception as e:
+                self.logger.warning(f"Failed to read response body of {params['response']['url']}: {e}")
+        return responses
+
     def close(self):
         """Closes the webdriver instance."""
         self.logger.info("Closing webdriver")
@@ -3,22 +3,29 @@ import os
 import sys
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 from tools.logging_manager import LoggingManager
+from tools.query_cache import QueryCache
 from utils.orm_base import Base
 
 class DatabaseManager:
+    # One read cache per database, shared by the managers bound to it so that writes
+    # through one manager invalidate the reads of the others
+    _query_caches = {}
+
     def __init__(self):
         db_url = json.loads(os.getenv("DATABASE_CONFIG"))["url"]
         if not db_url:
             raise ValueError("URL_BD not found in environment variables.")
         self.engine = create_engine(db_url)
         self.Session = sessionmaker(bind=self.engine)
+        self.query_cache = self._query_caches.setdefault(str(self.engine.url), QueryCache())
         self.logger = LoggingManager(logger_name="DatabaseManager").get_logger()
+        event.listen(self.Session, "after_flush", self._track_flushed_tables)
 
     @contextmanager
     def session_scope(self):
@@ -29,6 +36,7 @@ class DatabaseManager:
             yield session
             session.commit()
             self.logger.debug("Committed database session")
+            self.invalidate_cache(*session.info.pop("flushed_tables", ()))
         except Exception as e:
             session.rollback()
             self.logger.error(f"Rolled back database session due to error: {e}")
@@ -37,28 +45,90 @@ class DatabaseManager:
             session.close()
             self.logger.debug("Closed database session")
 
+    @staticmethod
+    def _track_flushed_tables(session, flush_context):
+        """Records the tables written by a flush, to invalidate their cached reads on commit."""
+        tables = session.info.setdefault("flushed_tables", set())
+        for entry in (*session.new, *session.dirty, *session.deleted):
+            tables.add(entry.__tablename__)
+
+    def invalidate_cache(self, *tables):
+        """Drops the cached reads of the given tables (table classes or names)."""
+        names = [getattr(table, "__tablename__", table) for table in tables]
+        if names:
+            self.query_cache.invalidate(*names)
+
+    def cache_stats(self):
+        """Returns the hit/miss counters of the read cache."""
+        return self.query_cache.stats()
+
     def create_tables(self):
         """Creates all tables if they do not exist."""
         self.logger.info("Creating tables...")
         Base.metadata.create_all(bind=self.engine)
 
+        from tools.dimension_normalizer import DimensionNormalizer
+        DimensionNormalizer(self).migrate_legacy_jobs()
+
     def add_entry(self, entry, table_class):
         """Adds a new entry to the database."""
         with self.session_scope() as session:
             session.add(entry)
             self.logger.info(f"Added entry to {table_class.__tablename__}")
+        self.invalidate_cache(table_class)
+
+    def get_entries(self, table_class, conditions=None, columns=None, use_cache=True):
+        """
+        Gets table entries based on optional conditions.
+
+        With `columns`, returns rows with only those columns. Results are served from the
+        read cache of the database until they expire or the table is written; cached entries are
+        detached from the session and shared between callers, so they should not be modified.
+        """
+        key = self.query_cache.make_key(table_class.__tablename__, conditions, columns) if use_cache else None
+        if key is not None:
+            hit, entries = self.query_cache.get(key)
+            if hit:
+                self.logger.debug(f"Served {len(entries)} entries from {table_class.__tablename__} from cache")
+                return entries
 
-    def get_entries(self, table_class, conditions=None):
-        """Gets table entries based on optional conditions."""
         with self.session_scope() as session:
-            query = session.query(table_class)
+            if columns:
+                query = session.query(*[getattr(table_class, column) for column in columns])
+            else:
+                query = session.query(table_class)
             if conditions:
-                query = query.filter_by(**conditions)
+                query = self._apply_conditions(query, table_class, conditions)
             entries = query.all()
+            if not columns:
+                # Detach before commit so the entries (and their joined relations) keep their loaded state
+                session.expunge_all()
             self.logger.info(
                 f"Retrieved {len(entries)} entries from {table_class.__tablename__}"
             )
-            return entries
+
+        if key is not None:
+            self.query_cache.set(key, entries)
+        return entries
+
+    @staticmethod
+    def _apply_conditions(query, table_class, conditions):
+        """
+        Filters a query by equality conditions. String values of dimension relationships
+        (e.g. {"work_format": "Remote"}) are matched on the dimension's normalized name.
+        """
+        from tools.dimension_normalizer import DimensionNormalizer
+
+        plain_conditions = {}
+        for key, value in conditions.items():
+            prop = getattr(getattr(table_class, key, None), "property", None)
+            target = getattr(getattr(prop, "mapper", None), "class_", None)
+            if isinstance(value, str) and hasattr(target, "normalized_name"):
+                normalized_name = DimensionNormalizer.normalize_text(value, target)
+                query = query.filter(getattr(table_class, key).has(normalized_name=normalized_name))
+            else:
+                plain_conditions[key] = value
+        return query.filter_by(**plain_conditions) if plain_conditions else query
 
     def update_entry(self, table_class, entry_id, updated_data):
         """Updates an entry in the database."""
@@ -75,6 +145,16 @@ class DatabaseManager:
                 self.logger.warning(
                     f"Entry with id {entry_id} not found in {table_class.__tablename__}."
                 )
+        self.invalidate_cache(table_class)
+
+    def bulk_update(self, table_class, mappings):
+        """Updates several entries at once from dicts containing their primary keys."""
+        if not mappings:
+            return
+        with self.session_scope() as session:
+            session.bulk_update_mappings(table_class, mappings)
+            self.logger.info(f"Updated {len(mappings)} entries in {table_class.__tablename__}")
+        self.invalidate_cache(table_class)
 
     def delete_entry(self, table_class, entry_id):
         """Deletes an entry from the database."""
@@ -87,3 +167,4 @@ class DatabaseManager:
                 self.logger.warning(
                     f"Entry with id {entry_id} not found in {table_class.__tablename__}."
                 )
+        self.invalidate_cache(table_class)
@@ -0,0 +1,154 @@
+import os
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+from sqlalchemy import MetaData, Table, inspect, insert, select, text
+from sqlalchemy.exc import IntegrityError
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
+from tools.logging_manager import LoggingManager
+from utils.orm_base import Company, JobsBaseInfo, Location, WorkFormat
+
+# Separators between the parts of a location, e.g. "São Paulo,SP"
+LOCATION_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+class DimensionNormalizer:
+    __DIMENSIONS = {
+        "company": Company,
+        "location": Location,
+        "work_format": WorkFormat,
+    }
+
+    def __init__(self, db_manager, cache_size=4096):
+        self.db_manager = db_manager
+        self.logger = LoggingManager(logger_name="DimensionNormalizer").get_logger()
+        self._key_for = lru_cache(maxsize=cache_size)(self._resolve_key)
+
+    def normalize_job(self, job_data):
+        """Replaces the raw dimension strings of a job with their surrogate keys."""
+        row = dict(job_data)
+        for field, table_class in self.__DIMENSIONS.items():
+            if field in row:
+                row[f"{field}_id"] = self._key_for(table_class, row.pop(field))
+        return row
+
+    def get_key(self, field, raw_value):
+        """Returns the surrogate key of a raw value for the given dimension field."""
+        return self._key_for(self.__DIMENSIONS[field], raw_value)
+
+    def cache_info(self):
+        """Returns the LRU cache statistics."""
+        return self._key_for.cache_info()
+
+    def clear_cache(self):
+        """Clears the LRU cache."""
+        self._key_for.cache_clear()
+
+    def migrate_legacy_jobs(self, batch_size=1000):
+        """
+        Converts a `jobs_base_info` table created before the dimension tables, which stores
+        `company`, `location` and `work_format` as strings, into the keyed layout.
+
+        The dimension tables are filled from the distinct strings, then the rows are copied
+        into a new table with their keys, which replaces the legacy one in a single transaction.
+
+        Returns:
+        The number of migrated rows, or 0 if the table is already up to date.
+        """
+        engine = self.db_manager.engine
+        table_name = JobsBaseInfo.__tablename__
+        inspector = inspect(engine)
+        if not inspector.has_table(table_name):
+            return 0
+        legacy_columns = {column["name"] for column in inspector.get_columns(table_name)}
+        if "company_id" in legacy_columns or not set(self.__DIMENSIONS) <= legacy_columns:
+            return 0
+
+        self.logger.warning(f"Migrating legacy {table_name} table to dimension keys.")
+        legacy = Table(table_name, MetaData(), autoload_with=engine)
+        with engine.connect() as connection:
+            raw_values = {
+                field: [raw_value for (raw_value,) in connection.execute(select(legacy.c[field]).distinct())]
+                for field in self.__DIMENSIONS
+            }
+        keys = {
+            field: {raw_value: self._key_for(table_class, raw_value or "") for raw_value in raw_values[field]}
+            for field, table_class in self.__DIMENSIONS.items()
+        }
+
+        new_name = f"{table_name}_new"
+        metadata = MetaData()
+        for table_class in self.__DIMENSIONS.values():
+            table_class.__table__.to_metadata(metadata)
+        new_table = JobsBaseInfo.__table__.to_metadata(metadata, name=new_name)
+        # Indexes are created once the table has its final name
+        new_table.indexes.clear()
+        copied_columns = [column.name for column in new_table.columns if column.name in legacy_columns]
+
+        migrated = 0
+        with engine.begin() as connection:
+            # Index names are shared by the whole schema, drop the legacy ones before creating the new table
+            for index in inspect(connection).get_indexes(table_name):
+                if index["name"] and not index.get("duplicates_constraint"):
+                    connection.execute(text(f'DROP INDEX "{index["name"]}"'))
+            new_table.create(connection)
+
+            rows = connection.execute(select(legacy)).mappings().all()
+            for start in range(0, len(rows), batch_size):
+                batch = []
+                for row in rows[start:start + batch_size]:
+                    values = {column: row[column] for column in copied_columns}
+                    for field in self.__DIMENSIONS:
+                        values[f"{field}_id"] = keys[field][row[field]]
+                    batch.append(values)
+                connection.execute(insert(new_table), batch)
+                migrated += len(batch)
+
+            legacy.drop(connection)
+            connection.execute(text(f'ALTER TABLE "{new_name}" RENAME TO "{table_name}"'))
+            for index in JobsBaseInfo.__table__.indexes:
+                index.create(connection)
+            if engine.dialect.name == "postgresql":
+                connection.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), COALESCE(MAX(id), 1)) FROM {table_name}"
+                ))
+
+        self.db_manager.invalidate_cache(JobsBaseInfo)
+        self.logger.info(f"Migrated {migrated} rows of {table_name} to dimension keys.")
+        return migrated
+
+    def _resolve_key(self, table_class, raw_value):
+        """Looks up the dimension row for a raw value, creating it if missing."""
+        normalized_name = self.normalize_text(raw_value, table_class)
+        for _ in range(2):
+            try:
+                with self.db_manager.session_scope() as session:
+                    entry = session.query(table_class).filter_by(normalized_name=normalized_name).first()
+                    if entry is None:
+                        entry = table_class(name=raw_value.strip(), normalized_name=normalized_name)
+                        session.add(entry)
+                        session.flush()
+                        self.logger.debug(f"Added '{normalized_name}' to {table_class.__tablename__}")
+                    return entry.id
+            except IntegrityError:
+                # Another writer inserted the same value in the meantime, read it back
+                self.logger.warning(f"Concurrent insert of '{normalized_name}' in {table_class.__tablename__}, retrying.")
+        raise ValueError(f"Could not resolve '{raw_value}' in {table_class.__tablename__}")
+
+    @staticmethod
+    def normalize_text(value, table_class=None):
+        """
+        Folds case, accents and whitespace so that spelling variants share a key.
+
+        Locations keep every part, including the state code, so that cities sharing a name
+        stay apart ("São Paulo,SP" -> "sao paulo, sp").
+        """
+        value = unicodedata.normalize("NFKD", value or "")
+        value = "".join(char for char in value if not unicodedata.combining(char))
+        value = " ".join(value.casefold().split())
+        if table_class is Location:
+            value = LOCATION_SEPARATOR.sub(", ", value)
+        return value
@@ -0,0 +1,187 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
+from tools.logging_manager import LoggingManager
+
+PROFILE_MODES = {"sampling", "webdriver"}
+
+# Numbers the collapsed-stack files of the process, across samplers
+_flush_sequence = itertools.count(1)
+
+
+class StackSampler(threading.Thread):
+    """
+    Samples the stack of one thread at a fixed wall-clock interval and periodically
+    writes the aggregated stacks in collapsed format ("a;b;c count"), ready for flamegraph tools.
+    """
+
+    def __init__(self, target_thread_id, output_dir, interval=0.01, flush_interval=60, max_depth=128):
+        super().__init__(name="StackSampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.output_dir = output_dir
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self.max_depth = max_depth
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        last_flush = time.monotonic()
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is not None:
+                self.stacks[self._collapse(frame)] += 1
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self.flush()
+                last_flush = time.monotonic()
+
+    def stop(self):
+        """Stops sampling and writes the remaining samples."""
+        self._stop_event.set()
+        self.join()
+        self.flush()
+
+    def flush(self):
+        """Writes the samples collected since the last flush to a new file."""
+        if not self.stacks:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(
+            self.output_dir, f"stacks-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_flush_sequence)}.collapsed"
+        )
+        with open(path, "w") as f:
+            for stack, count in self.stacks.items():
+                f.write(f"{stack} {count}\n")
+        self.stacks = Counter()
+        return path
+
+    def _collapse(self, frame):
+        frames = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+
+class ProfilingManager:
+    """
+    Opt-in profiling controlled by the PROFILE_MODE environment variable, a comma-separated
+    list of modes:
+    - sampling: samples the stack of profiled calls into data/profiles/<SESSION_UID>/*.collapsed
+    - webdriver: counts every WebDriver command and its latency into data/profiles/<SESSION_UID>/webdriver.json
+    """
+    _instance = None
+
+    def __init__(self):
+        self.session_id = os.getenv('SESSION_UID', 'default')
+        self.modes = {mode.strip().lower() for mode in os.getenv('PROFILE_MODE', '').split(',') if mode.strip()}
+        self.interval = float(os.getenv('PROFILE_INTERVAL', '0.01'))
+        self.flush_interval = 60
+        self.output_dir = os.path.join('data', 'profiles', self.session_id)
+        self.logger = LoggingManager(logger_name='ProfilingManager').get_logger()
+
+        self.command_stats = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        self._stats_lock = threading.Lock()
+        self._last_stats_flush = time.monotonic()
+
+        unknown = self.modes - PROFILE_MODES
+        if unknown:
+            self.logger.warning(f"Unknown profile modes ignored: {', '.join(sorted(unknown))}")
+        if self.webdriver_enabled:
+            atexit.register(self.flush_command_stats)
+        if self.modes & PROFILE_MODES:
+            self.logger.info(f"Profiling enabled ({', '.join(sorted(self.modes & PROFILE_MODES))}), writing to {self.output_dir}")
+
+    @classmethod
+    def get(cls):
+        """Returns the process-wide profiling manager."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def sampling_enabled(self):
+        return "sampling" in self.modes
+
+    @property
+    def webdriver_enabled(self):
+        return "webdriver" in self.modes
+
+    @contextmanager
+    def sample(self):
+        """Samples the current thread while the block runs, if sampling is enabled."""
+        if not self.sampling_enabled:
+            yield
+            return
+
+        sampler = StackSampler(threading.get_ident(), self.output_dir, self.interval, self.flush_interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+
+    def instrument_driver(self, driver):
+        """Wraps the command executor of a WebDriver to record call counts and latencies."""
+        if not self.webdriver_enabled:
+            return driver
+
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def timed_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self._record_command(driver_command, (time.perf_counter() - started) * 1000)
+
+        driver.execute = timed_execute
+        self.logger.info("WebDriver commands instrumented")
+        return driver
+
+    def flush_command_stats(self):
+        """Writes the WebDriver command statistics of the session."""
+        with self._stats_lock:
+            stats = {
+                command: {**values, "mean_ms": values["total_ms"] / values["count"]}
+                for command, values in self.command_stats.items()
+            }
+            self._last_stats_flush = time.monotonic()
+        if not stats:
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, "webdriver.json")
+        with open(path, "w") as f:
+            json.dump(stats, f, indent=2, sort_keys=True)
+        return path
+
+    def _record_command(self, command, elapsed_ms):
+        with self._stats_lock:
+            stats = self.command_stats[command]
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            due = time.monotonic() - self._last_stats_flush >= self.flush_interval
+        if due:
+            self.flush_command_stats()
+
+
+def profiled(method):
+    """Runs the decorated function under the stack sampler when sampling is enabled."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with ProfilingManager.get().sample():
+            return method(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,66 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    """
+    Size-bounded LRU cache of query results with a time-to-live.
+
+    Entries are keyed by (table, conditions, projection) and can be invalidated per table.
+    """
+
+    def __init__(self, ttl=30, max_entries=256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(table_name, conditions=None, columns=None):
+        """Builds a cache key, or returns None if the conditions are not hashable."""
+        key = (table_name, tuple(sorted((conditions or {}).items())), tuple(columns or ()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key):
+        """Returns (True, value) on a fresh hit, (False, None) otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key, value):
+        """Stores a value, evicting the least recently used entries beyond `max_entries`."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *table_names):
+        """Drops every entry of the given tables."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in table_names]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Returns the hit/miss counters and the current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,163 @@
+import hashlib
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, MetaData, Table, delete, insert, select, text
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
+from tools.logging_manager import LoggingManager
+from utils.orm_base import JobsBaseInfo, JobUrlHash
+
+
+def url_hash(url):
+    """Returns a signed 64-bit hash of a job URL."""
+    return int.from_bytes(hashlib.sha256(url.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def existing_urls(session, urls):
+    """Returns the subset of URLs already stored, in the hot table or in the archives."""
+    if not urls:
+        return set()
+    known = {
+        row.url for row in session.query(JobsBaseInfo.url).filter(JobsBaseInfo.url.in_(urls)).all()
+    }
+    hashes = {url_hash(url): url for url in urls if url not in known}
+    if hashes:
+        archived = session.query(JobUrlHash.url_hash).filter(JobUrlHash.url_hash.in_(hashes)).all()
+        known.update(hashes[row.url_hash] for row in archived)
+    return known
+
+
+class RetentionManager:
+    """
+    Keeps `jobs_base_info` small by moving old rows into monthly archive tables
+    (`jobs_base_info_YYYY_MM`). The URL of every archived row is kept in `job_url_hashes`
+    so that duplicate checks still see it.
+    """
+
+    def __init__(self, db_manager, horizon_days=None, maintenance_interval_hours=24, batch_size=1000):
+        self.db_manager = db_manager
+        self.horizon_days = horizon_days if horizon_days is not None else int(os.getenv('RETENTION_DAYS', '180'))
+        self.maintenance_interval = maintenance_interval_hours * 3600
+        self.batch_size = batch_size
+        self.logger = LoggingManager(logger_name="RetentionManager").get_logger()
+        self._archive_metadata = MetaData()
+        self._last_run = None
+
+    def run_if_due(self):
+        """
+        Archives the old rows and refreshes the database if the maintenance interval has elapsed.
+        The database is only compacted when rows were archived.
+
+        The run is scheduled even when it fails, so a failing step is retried on the
+        next interval instead of on every call.
+        """
+        if self._last_run is not None and time.monotonic() - self._last_run < self.maintenance_interval:
+            return False
+        try:
+            archived = self.archive()
+            self.maintain(vacuum=archived > 0)
+        finally:
+            self._last_run = time.monotonic()
+        return True
+
+    def archive(self):
+        """
+        Moves the rows older than the horizon into their monthly archive tables.
+
+        Returns:
+        The number of archived rows.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=self.horizon_days)
+        with self.db_manager.session_scope() as session:
+            oldest = session.query(JobsBaseInfo.registration_date).filter(
+                JobsBaseInfo.registration_date < cutoff
+            ).order_by(JobsBaseInfo.registration_date).first()
+        if oldest is None:
+            self.logger.info("No rows older than the retention horizon.")
+            return 0
+
+        archived = 0
+        month_start = oldest.registration_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        while month_start < cutoff:
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            archived += self._archive_month(month_start, min(next_month, cutoff))
+            month_start = next_month
+
+        self.logger.info(f"Archived {archived} rows older than {cutoff:%Y-%m-%d}.")
+        return archived
+
+    def maintain(self, vacuum=True):
+        """
+        Refreshes the planner statistics and, with `vacuum`, reclaims the space of archived rows.
+
+        On SQLite, VACUUM rewrites the whole file, archives included, under an exclusive lock,
+        so it should only run after rows were moved.
+        """
+        dialect = self.db_manager.engine.dialect.name
+        table_name = JobsBaseInfo.__tablename__
+        with self.db_manager.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            if dialect == "sqlite":
+                if vacuum:
+                    connection.execute(text("VACUUM"))
+                connection.execute(text(f"ANALYZE {table_name}"))
+            elif dialect == "postgresql":
+                connection.execute(text(f"{'VACUUM ' if vacuum else ''}ANALYZE {table_name}"))
+            else:
+                self.logger.warning(f"No maintenance commands for the {dialect} dialect.")
+                return
+        self.logger.info(f"Ran database maintenance ({dialect}, {'vacuum and analyze' if vacuum else 'analyze only'}).")
+
+    def _archive_month(self, start, end):
+        """Moves the rows registered in [start, end) in batches."""
+        hot = JobsBaseInfo.__table__
+        archive = self._archive_table(start)
+        columns = [column.name for column in hot.columns]
+
+        moved = 0
+        while True:
+            with self.db_manager.session_scope() as session:
+                rows = session.execute(
+                    select(hot.c.id, hot.c.url)
+                    .where(hot.c.registration_date >= start, hot.c.registration_date < end)
+                    .limit(self.batch_size)
+                ).all()
+                if not rows:
+                    break
+                if not moved:
+                    archive.create(bind=session.connection(), checkfirst=True)
+
+                ids = [row.id for row in rows]
+                session.execute(
+                    insert(archive).from_select(columns, select(*[hot.c[name] for name in columns]).where(hot.c.id.in_(ids)))
+                )
+                hashes = {url_hash(row.url) for row in rows}
+                stored = {
+                    row.url_hash for row in session.query(JobUrlHash.url_hash).filter(JobUrlHash.url_hash.in_(hashes))
+                }
+                session.add_all(
+                    JobUrlHash(url_hash=value, archive_table=archive.name) for value in hashes - stored
+                )
+                session.execute(delete(hot).where(hot.c.id.in_(ids)))
+                moved += len(ids)
+
+        if moved:
+            self.db_manager.invalidate_cache(JobsBaseInfo)
+            self.logger.info(f"Moved {moved} rows into {archive.name}.")
+        return moved
+
+    def _archive_table(self, month):
+        """Returns the archive table of a month, without the hot table's indexes and constraints."""
+        name = f"{JobsBaseInfo.__tablename__}_{month:%Y_%m}"
+        if name in self._archive_metadata.tables:
+            return self._archive_metadata.tables[name]
+        return Table(
+            name,
+            self._archive_metadata,
+            *[
+                Column(column.name, column.type, primary_key=column.primary_key, autoincrement=False)
+                for column in JobsBaseInfo.__table__.columns
+            ],
+        )
@@ -0,0 +1,69 @@
+import hashlib
+import os
+import sys
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, only needed when capturing or reading snapshots
+    zstandard = None
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
+from tools.logging_manager import LoggingManager
+from utils.orm_base import PageSnapshot
+
+
+class SnapshotStore:
+    """
+    Content-addressed store of zstd-compressed page sources.
+
+    Blobs live in `<root>/<hash[:2]>/<hash>.html.zst` and are written once per distinct
+    content; every capture is indexed in the `page_snapshots` table by (search, page, captured_at).
+    """
+
+    def __init__(self, db_manager, root="data/snapshots", level=9):
+        if zstandard is None:
+            raise ImportError("Snapshot capture requires the 'zstandard' package.")
+        self.db_manager = db_manager
+        self.root = root
+        self.level = level
+        self.logger = LoggingManager(logger_name="SnapshotStore").get_logger()
+
+    def save(self, page_source, platform, search, page):
+        """Stores a page source and indexes the capture. Returns its content hash."""
+        data = page_source.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(content_hash)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(zstandard.ZstdCompressor(level=self.level).compress(data))
+            os.replace(tmp_path, path)
+            self.logger.debug(f"Stored snapshot {content_hash} ({len(data)} bytes)")
+        else:
+            self.logger.debug(f"Snapshot {content_hash} already stored, indexing only")
+
+        self.db_manager.add_entry(
+            PageSnapshot(
+                platform=platform,
+                search=search,
+                page=page,
+                session_id=os.getenv("SESSION_UID"),
+                content_hash=content_hash,
+            ),
+            PageSnapshot,
+        )
+        return content_hash
+
+    def blob_path(self, content_hash):
+        """Returns the file path of a snapshot blob."""
+        return os.path.join(self.root, content_hash[:2], f"{content_hash}.html.zst")
+
+    @staticmethod
+    def read_blob(path):
+        """Reads and decompresses a snapshot blob."""
+        if zstandard is None:
+            raise ImportError("Reading snapshots requires the 'zstandard' package.")
+        with open(path, "rb") as f:
+            return zstandard.ZstdDecompressor().decompress(f.read()).decode("utf-8")
@@ -0,0 +1,159 @@
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException
+)
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
+from tools.logging_manager import LoggingManager
+
+
+class RateLimitError(Exception):
+    """Raised when the platform answers with a rate-limit, checkpoint or authwall page."""
+
+
+class ThrottleController:
+    """
+    Adaptive pacing for a single platform account.
+
+    The delay between page loads follows AIMD: it shrinks by `decrease_step` after every
+    healthy page and is multiplied by `increase_factor` on latency spikes and failures.
+    Failures are additionally backed off exponentially with full jitter, and a circuit
+    breaker asks the caller to recreate the driver or pauses the account.
+    """
+    RECREATE_DRIVER = "recreate_driver"
+    PAUSE_ACCOUNT = "pause_account"
+    RETRY = "retry"
+
+    _instances = {}
+
+    def __init__(
+        self,
+        platform,
+        account_id,
+        initial_delay=3.0,
+        min_delay=1.0,
+        max_delay=60.0,
+        decrease_step=0.25,
+        increase_factor=2.0,
+        latency_spike_ratio=2.0,
+        backoff_base=5.0,
+        backoff_cap=300.0,
+        failure_threshold=5,
+        pause_seconds=1800,
+    ):
+        self.platform = platform
+        self.account_id = account_id
+        self.delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.decrease_step = decrease_step
+        self.increase_factor = increase_factor
+        self.latency_spike_ratio = latency_spike_ratio
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.failure_threshold = failure_threshold
+        self.pause_seconds = pause_seconds
+
+        self.latency_avg = None
+        self.consecutive_failures = 0
+        self.error_counts = Counter()
+        self.paused_until = 0.0
+        self._last_request = 0.0
+        self.logger = LoggingManager(logger_name="ThrottleController").get_logger()
+
+    @classmethod
+    def for_account(cls, platform, account_id, **kwargs):
+        """Returns the shared controller of a platform account, creating it if needed."""
+        key = (platform, account_id)
+        if key not in cls._instances:
+            cls._instances[key] = cls(platform, account_id, **kwargs)
+        return cls._instances[key]
+
+    def wait(self):
+        """Sleeps until the account is unpaused and the current delay has elapsed."""
+        now = time.monotonic()
+        if self.paused_until > now:
+            self.logger.warning(f"{self.platform} account {self.account_id} paused for {self.paused_until - now:.0f}s.")
+            time.sleep(self.paused_until - now)
+            now = time.monotonic()
+
+        remaining = self._last_request + self.delay - now
+        if remaining > 0:
+            time.sleep(remaining)
+        self._last_request = time.monotonic()
+
+    def record_success(self, latency=None):
+        """Registers a healthy page load and adapts the delay to its latency."""
+        self.consecutive_failures = 0
+        if latency is None:
+            self._decrease_delay()
+            return
+
+        if self.latency_avg is not None and latency > self.latency_avg * self.latency_spike_ratio:
+            self.logger.warning(f"Latency spike on {self.platform}: {latency:.2f}s (average {self.latency_avg:.2f}s).")
+            self._increase_delay()
+        else:
+            self._decrease_delay()
+        self.latency_avg = latency if self.latency_avg is None else 0.8 * self.latency_avg + 0.2 * latency
+
+    def record_failure(self, error):
+        """
+        Registers a failure, backs off and decides how the caller should recover.
+
+        Returns:
+        RECREATE_DRIVER, PAUSE_ACCOUNT or RETRY.
+        """
+        error_class = self.classify(error)
+        self.error_counts[error_class] += 1
+        self.consecutive_failures += 1
+        self._increase_delay()
+        self.logger.error(
+            f"{self.platform} account {self.account_id} failure #{self.consecutive_failures} ({error_class}): {error}"
+        )
+
+        if error_class == "driver":
+            self.consecutive_failures = 0
+            return self.RECREATE_DRIVER
+
+        if self.consecutive_failures >= self.failure_threshold:
+            self.consecutive_failures = 0
+            if error_class == "rate_limit":
+                self.paused_until = time.monotonic() + self.pause_seconds
+                self.logger.warning(f"Circuit open, pausing {self.platform} account {self.account_id} for {self.pause_seconds}s.")
+                return self.PAUSE_ACCOUNT
+            self.logger.warning(f"Circuit open for {self.platform} account {self.account_id}, recreating driver.")
+            return self.RECREATE_DRIVER
+
+        backoff = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** self.consecutive_failures))
+        self.logger.info(f"Backing off {backoff:.1f}s before retrying.")
+        time.sleep(backoff)
+        return self.RETRY
+
+    @staticmethod
+    def classify(error):
+        """Maps an exception to one of: timeout, rate_limit, driver, other."""
+        if isinstance(error, RateLimitError):
+            return "rate_limit"
+        if isinstance(error, TimeoutException):
+            return "timeout"
+        if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+            return "driver"
+        if isinstance(error, WebDriverException) and any(
+            message in str(error).lower() for message in ("invalid session id", "disconnected", "no such window")
+        ):
+            return "driver"
+        if "max retries exceeded" in str(error).lower():
+            # urllib3 error raised when the local driver process is gone
+            return "driver"
+        return "other"
+
+    def _increase_delay(self):
+        self.delay = min(self.max_delay, self.delay * self.increase_factor)
+
+    def _decrease_delay(self):
+        self.delay = max(self.min_delay, self.delay - self.decrease_step)
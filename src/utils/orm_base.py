@@ -4,7 +4,7 @@ import sys
 from datetime import datetime
 from dotenv import load_dotenv
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, LargeBinary, JSON, Index
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, Integer, String, LargeBinary, JSON, Index, Text
 from sqlalchemy.orm import declarative_base, relationship
 from cryptography.fernet import Fernet
 
@@ -85,21 +85,76 @@ class Account(Base):
     user = relationship("User", back_populates="accounts")
 
 
+class Company(Base):
+    __tablename__ = "companies"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    normalized_name = Column(String, nullable=False, unique=True, index=True)
+
+
+class Location(Base):
+    __tablename__ = "locations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    normalized_name = Column(String, nullable=False, unique=True, index=True)
+
+
+class WorkFormat(Base):
+    __tablename__ = "work_formats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    normalized_name = Column(String, nullable=False, unique=True, index=True)
+
+
 class JobsBaseInfo(Base):
     __tablename__ = "jobs_base_info"
     __table_args__ = (
-        Index('idx_company', 'company'),
-        Index('idx_location', 'location'),
-        Index('idx_work_format', 'work_format'),
+        Index('idx_company', 'company_id'),
+        Index('idx_location', 'location_id'),
+        Index('idx_work_format', 'work_format_id'),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     platform = Column(String, nullable=False)
     title = Column(String, nullable=False)
-    company = Column(String, nullable=False, index=True)
-    location = Column(String, nullable=False, index=True)
-    work_format = Column(String, nullable=False, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    location_id = Column(Integer, ForeignKey("locations.id"), nullable=False)
+    work_format_id = Column(Integer, ForeignKey("work_formats.id"), nullable=False)
     url = Column(String, nullable=False, unique=True)
+    description = Column(Text)
+    seniority = Column(String)
+    applicant_count = Column(Integer)
+    details_fetched_at = Column(DateTime)
+    details_attempts = Column(Integer, nullable=False, default=0)
     processed = Column(Boolean, default=False)
     registration_date = Column(DateTime, default=datetime.utcnow)
     processing_date = Column(DateTime)
+    company = relationship("Company", lazy="joined")
+    location = relationship("Location", lazy="joined")
+    work_format = relationship("WorkFormat", lazy="joined")
+
+
+class JobUrlHash(Base):
+    __tablename__ = "job_url_hashes"
+
+    url_hash = Column(BigInteger, primary_key=True, autoincrement=False)
+    archive_table = Column(String, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+
+class PageSnapshot(Base):
+    __tablename__ = "page_snapshots"
+    __table_args__ = (
+        Index('idx_snapshot_search_page', 'search', 'page', 'captured_at'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    platform = Column(String, nullable=False)
+    search = Column(String, nullable=False)
+    page = Column(Integer, nullable=False)
+    session_id = Column(String)
+    content_hash = Column(String, nullable=False, index=True)
+    captured_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,33 @@
+import re
+
+seniority_levels = (
+    "Internship", "Entry level", "Associate", "Mid-Senior level", "Director", "Executive",
+    "Estágio", "Assistente", "Júnior", "Pleno-sênior", "Diretor", "Executivo",
+)
+applicants_pattern = re.compile(r"(\d[\d.,]*)\s*(?:applicants|candidaturas|candidatos)", re.IGNORECASE)
+
+
+def parse_location(text):
+    """
+    Splits a card metadata text like "São Paulo, SP (Remote)" into location and work format.
+    """
+    location_element = text.split("(")
+    if len(location_element) > 1:
+        return location_element[0].strip(), location_element[1].rstrip(")")
+    return location_element[0], 'N/A'
+
+
+def parse_job_details(raw_details):
+    """
+    Builds the description, seniority and applicant count from the job page texts.
+    """
+    insights = " | ".join(raw_details.get('insights') or [])
+    seniority = next(
+        (level for level in seniority_levels if level.lower() in insights.lower()), None
+    )
+    applicants = applicants_pattern.search(f"{raw_details.get('top_card', '')} | {insights}")
+    return {
+        'description': raw_details['description'].strip(),
+        'seniority': seniority,
+        'applicant_count': int(re.sub(r"[.,]", "", applicants.group(1))) if applicants else None,
+    }
@@ -0,0 +1,22 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    """DatabaseManager bound to an empty SQLite database in a temporary directory."""
+    for module in ("sqlalchemy", "loguru", "dotenv"):
+        pytest.importorskip(module)
+    fernet = pytest.importorskip("cryptography.fernet")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SECRET_KEY", json.dumps({"key": fernet.Fernet.generate_key().decode()}))
+    monkeypatch.setenv("DATABASE_CONFIG", json.dumps({"url": f"sqlite:///{tmp_path / 'db.sqlite'}"}))
+
+    from tools.database_manager import DatabaseManager
+    return DatabaseManager()
@@ -0,0 +1,110 @@
+import pytest
+
+text = pytest.importorskip("sqlalchemy").text
+
+LEGACY_JOBS_TABLE = """
+    CREATE TABLE jobs_base_info (
+        id INTEGER NOT NULL PRIMARY KEY,
+        platform VARCHAR NOT NULL,
+        title VARCHAR NOT NULL,
+        company VARCHAR NOT NULL,
+        location VARCHAR NOT NULL,
+        work_format VARCHAR NOT NULL,
+        url VARCHAR NOT NULL UNIQUE,
+        processed BOOLEAN,
+        registration_date DATETIME,
+        processing_date DATETIME
+    )
+"""
+
+
+def test_create_tables_migrates_legacy_jobs(db_manager):
+    from utils.orm_base import JobsBaseInfo
+
+    with db_manager.engine.begin() as connection:
+        connection.execute(text(LEGACY_JOBS_TABLE))
+        connection.execute(text("CREATE INDEX idx_company ON jobs_base_info (company)"))
+        connection.execute(text(
+            "INSERT INTO jobs_base_info (id, platform, title, company, location, work_format, url, processed) VALUES "
+            "(1, 'LinkedIn', 'Data Engineer', 'ACME', 'São Paulo, SP', 'Remote', 'u1', 0), "
+            "(2, 'LinkedIn', 'Data Analyst', 'acme', 'Sao Paulo,sp', 'Remote', 'u2', 1), "
+            "(3, 'LinkedIn', 'Data Analyst', 'ACME', 'Bom Jesus, PI', 'Remote', 'u3', 0), "
+            "(4, 'LinkedIn', 'Data Analyst', 'ACME', 'Bom Jesus, RS', 'Remote', 'u4', 0)"
+        ))
+
+    db_manager.create_tables()
+    db_manager.create_tables()
+
+    jobs = sorted(db_manager.get_entries(JobsBaseInfo), key=lambda job: job.id)
+    assert [job.url for job in jobs] == ["u1", "u2", "u3", "u4"]
+    assert jobs[0].company_id == jobs[1].company_id
+    assert jobs[0].location_id == jobs[1].location_id
+    assert jobs[2].location_id != jobs[3].location_id
+    assert [job.location.name for job in jobs[2:]] == ["Bom Jesus, PI", "Bom Jesus, RS"]
+    assert jobs[0].company.name == "ACME"
+    assert jobs[1].work_format.name == "Remote"
+    assert jobs[1].processed is True
+    assert [job.details_attempts for job in jobs] == [0, 0, 0, 0]
+
+
+def test_get_entries_filters_dimensions_by_string(db_manager):
+    from tools.dimension_normalizer import DimensionNormalizer
+    from utils.orm_base import JobsBaseInfo
+
+    db_manager.create_tables()
+    normalizer = DimensionNormalizer(db_manager)
+    for url, location, work_format in (("u1", "São Paulo, SP", "Remote"), ("u2", "Rio de Janeiro", "Hybrid")):
+        job_row = normalizer.normalize_job({
+            "platform": "LinkedIn", "title": "Engineer", "company": "ACME",
+            "location": location, "work_format": work_format, "url": url,
+        })
+        db_manager.add_entry(JobsBaseInfo(**job_row), JobsBaseInfo)
+
+    assert [job.url for job in db_manager.get_entries(JobsBaseInfo, {"work_format": "Remote"})] == ["u1"]
+    assert [job.url for job in db_manager.get_entries(JobsBaseInfo, {"location": "sao paulo,SP"})] == ["u1"]
+    assert [job.url for job in db_manager.get_entries(JobsBaseInfo, {"company": "acme", "url": "u2"})] == ["u2"]
+
+
+def test_retention_schedules_next_run_after_failure(db_manager, monkeypatch):
+    from tools.retention_manager import RetentionManager
+
+    monkeypatch.setenv("RETENTION_DAYS", "30")
+    retention = RetentionManager(db_manager)
+    assert retention.horizon_days == 30
+
+    def fail():
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(retention, "archive", fail)
+    with pytest.raises(RuntimeError):
+        retention.run_if_due()
+    assert retention.run_if_due() is False
+
+
+def test_retention_only_vacuums_after_archiving(db_manager):
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import event
+    from tools.dimension_normalizer import DimensionNormalizer
+    from tools.retention_manager import RetentionManager
+    from utils.orm_base import JobsBaseInfo
+
+    db_manager.create_tables()
+    statements = []
+    event.listen(db_manager.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    retention = RetentionManager(db_manager, horizon_days=30, maintenance_interval_hours=0)
+
+    assert retention.run_if_due() is True
+    assert "VACUUM" not in statements
+    assert "ANALYZE jobs_base_info" in statements
+
+    job_row = DimensionNormalizer(db_manager).normalize_job({
+        "platform": "LinkedIn", "title": "Engineer", "company": "ACME",
+        "location": "Brasil", "work_format": "Remote", "url": "u1",
+    })
+    db_manager.add_entry(JobsBaseInfo(**job_row, registration_date=datetime.utcnow() - timedelta(days=60)), JobsBaseInfo)
+    statements.clear()
+
+    assert retention.run_if_due() is True
+    assert "VACUUM" in statements
+    assert db_manager.get_entries(JobsBaseInfo) == []
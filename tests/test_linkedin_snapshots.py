@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+pytest.importorskip("lxml")
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "linkedin_search_results.html")
+
+
+def test_extract_jobs_from_html_reads_open_cards(db_manager):
+    from scraping.linkedin_snapshots import extract_jobs_from_html
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        jobs = extract_jobs_from_html(f.read())
+
+    assert jobs == [
+        {
+            'platform': 'LinkedIn',
+            'title': 'Engenheiro de Dados',
+            'company': 'ACME Tecnologia',
+            'location': 'São Paulo, SP',
+            'work_format': 'Remoto',
+            'url': 'https://www.linkedin.com/jobs/view/3912345678/',
+        },
+        {
+            'platform': 'LinkedIn',
+            'title': 'Engenheiro de Machine Learning',
+            'company': 'Gama Ltda',
+            'location': 'Rio de Janeiro, RJ',
+            'work_format': 'Híbrido',
+            'url': 'https://www.linkedin.com/jobs/view/3912345681/',
+        },
+    ]
+
+
+def test_extractor_does_not_create_the_snapshot_root(db_manager, tmp_path):
+    pytest.importorskip("zstandard")
+    from scraping.linkedin_snapshots import LinkedInSnapshotExtractor
+
+    db_manager.create_tables()
+    root = tmp_path / "snapshots"
+    extractor = LinkedInSnapshotExtractor(db_manager, root=str(root))
+
+    assert extractor.run() == 0
+    assert not root.exists()
@@ -0,0 +1,40 @@
+import os
+
+from scraping.linkedin_voyager import load_voyager_payload, parse_voyager_jobs, record_voyager_payload
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "voyager_job_cards.json")
+
+
+def test_parse_voyager_jobs_decodes_job_cards():
+    jobs = parse_voyager_jobs(load_voyager_payload(FIXTURE))
+
+    assert jobs == [
+        {
+            'platform': 'LinkedIn',
+            'title': 'Engenheiro de Dados',
+            'company': 'ACME Tecnologia',
+            'location': 'São Paulo, SP',
+            'work_format': 'Remoto',
+            'url': 'https://www.linkedin.com/jobs/view/3912345678/',
+        },
+        {
+            'platform': 'LinkedIn',
+            'title': 'Data Analyst',
+            'company': 'Beta S.A.',
+            'location': 'Brasil',
+            'work_format': 'N/A',
+            'url': 'https://www.linkedin.com/jobs/view/3923456789/',
+        },
+    ]
+
+
+def test_parse_voyager_jobs_ignores_payloads_without_cards():
+    assert parse_voyager_jobs({}) == []
+    assert parse_voyager_jobs({"data": {"included": [{"$type": "com.linkedin.voyager.dash.jobs.JobPosting"}]}}) == []
+
+
+def test_recorded_payload_round_trip(tmp_path):
+    payload = load_voyager_payload(FIXTURE)
+    path = record_voyager_payload(payload, tmp_path, "page_1")
+
+    assert parse_voyager_jobs(load_voyager_payload(path)) == parse_voyager_jobs(payload)
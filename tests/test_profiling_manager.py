@@ -0,0 +1,119 @@
+import atexit
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from tools import profiling_manager
+from tools.profiling_manager import ProfilingManager, StackSampler
+
+
+@pytest.fixture(autouse=True)
+def profile_dir(tmp_path, monkeypatch):
+    # Profiles and logs are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SESSION_UID", "test-session")
+    return tmp_path / "data" / "profiles" / "test-session"
+
+
+@pytest.fixture
+def webdriver_profiler(monkeypatch):
+    monkeypatch.setenv("PROFILE_MODE", "webdriver")
+    profiler = ProfilingManager()
+    yield profiler
+    atexit.unregister(profiler.flush_command_stats)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append((driver_command, params))
+        if driver_command == "quit":
+            raise RuntimeError("driver gone")
+        return {"value": driver_command}
+
+
+def outer(sampler):
+    return inner(sampler)
+
+
+def inner(sampler):
+    return sampler._collapse(sys._getframe())
+
+
+def test_collapse_joins_frames_from_root_to_leaf(profile_dir):
+    sampler = StackSampler(0, str(profile_dir))
+
+    stack = sampler._collapse(sys._getframe()).split(";")
+    assert stack[-1] == "test_profiling_manager.py:test_collapse_joins_frames_from_root_to_leaf"
+
+    stack = outer(sampler).split(";")
+    assert stack[-3:] == [
+        "test_profiling_manager.py:test_collapse_joins_frames_from_root_to_leaf",
+        "test_profiling_manager.py:outer",
+        "test_profiling_manager.py:inner",
+    ]
+
+
+def test_collapse_keeps_the_innermost_frames_up_to_max_depth(profile_dir):
+    sampler = StackSampler(0, str(profile_dir), max_depth=2)
+
+    assert outer(sampler) == "test_profiling_manager.py:outer;test_profiling_manager.py:inner"
+
+
+def test_flush_writes_collapsed_stacks_to_a_new_file(profile_dir):
+    sampler = StackSampler(0, str(profile_dir))
+    assert sampler.flush() is None
+
+    sampler.stacks["main.py:main;linkedin.py:search_jobs"] += 3
+    sampler.stacks["main.py:main;linkedin.py:search_jobs;linkedin.py:_get_job_data"] += 1
+    first = sampler.flush()
+    sampler.stacks["main.py:main"] += 2
+    second = sampler.flush()
+
+    assert first != second
+    assert first.endswith(".collapsed") and first.startswith(str(profile_dir))
+    with open(first) as f:
+        assert f.read().splitlines() == [
+            "main.py:main;linkedin.py:search_jobs 3",
+            "main.py:main;linkedin.py:search_jobs;linkedin.py:_get_job_data 1",
+        ]
+    with open(second) as f:
+        assert f.read() == "main.py:main 2\n"
+    assert not sampler.stacks
+
+
+def test_instrument_driver_is_a_no_op_without_webdriver_mode(monkeypatch):
+    monkeypatch.setenv("PROFILE_MODE", "sampling")
+    driver = FakeDriver()
+    execute = driver.execute
+
+    assert ProfilingManager().instrument_driver(driver).execute == execute
+
+
+def test_instrument_driver_records_command_counts_and_latencies(webdriver_profiler, profile_dir, monkeypatch):
+    timestamps = iter([0.0, 0.010, 1.0, 1.030, 2.0, 2.005])
+    monkeypatch.setattr(profiling_manager.time, "perf_counter", lambda: next(timestamps))
+    driver = webdriver_profiler.instrument_driver(FakeDriver())
+
+    assert driver.execute("get", {"url": "https://www.linkedin.com/jobs/"}) == {"value": "get"}
+    driver.execute("get", {"url": "https://www.linkedin.com/jobs/search/"})
+    with pytest.raises(RuntimeError):
+        driver.execute("quit")
+
+    assert [command for command, _ in driver.commands] == ["get", "get", "quit"]
+    path = webdriver_profiler.flush_command_stats()
+    assert os.path.abspath(path) == str(profile_dir / "webdriver.json")
+    with open(path) as f:
+        stats = json.load(f)
+    assert stats["get"]["count"] == 2
+    assert stats["get"]["total_ms"] == pytest.approx(40.0)
+    assert stats["get"]["max_ms"] == pytest.approx(30.0)
+    assert stats["get"]["mean_ms"] == pytest.approx(20.0)
+    assert stats["quit"]["count"] == 1
+    assert stats["quit"]["max_ms"] == pytest.approx(5.0)
@@ -0,0 +1,97 @@
+import json
+
+from tools.query_cache import QueryCache
+
+
+def test_make_key_includes_table_conditions_and_projection():
+    key = QueryCache.make_key("jobs_base_info", {"work_format": "Remote", "processed": False}, ["id", "url"])
+
+    assert key == QueryCache.make_key("jobs_base_info", {"processed": False, "work_format": "Remote"}, ["id", "url"])
+    assert key != QueryCache.make_key("jobs_base_info", {"work_format": "Hybrid", "processed": False}, ["id", "url"])
+    assert key != QueryCache.make_key("jobs_base_info", {"work_format": "Remote", "processed": False})
+    assert key != QueryCache.make_key("companies", {"work_format": "Remote", "processed": False}, ["id", "url"])
+    assert QueryCache.make_key("jobs_base_info", {"id": [1, 2]}) is None
+
+
+def test_get_set_counts_hits_and_misses():
+    cache = QueryCache()
+    key = QueryCache.make_key("jobs_base_info", {"work_format": "Remote"})
+
+    assert cache.get(key) == (False, None)
+    cache.set(key, ["job"])
+    assert cache.get(key) == (True, ["job"])
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_entries_expire_after_ttl():
+    cache = QueryCache(ttl=0)
+    key = QueryCache.make_key("jobs_base_info")
+    cache.set(key, [])
+
+    assert cache.get(key) == (False, None)
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(max_entries=2)
+    first, second, third = (QueryCache.make_key("jobs_base_info", {"id": index}) for index in range(3))
+    cache.set(first, 1)
+    cache.set(second, 2)
+    cache.get(first)
+    cache.set(third, 3)
+
+    assert cache.get(second) == (False, None)
+    assert cache.get(first) == (True, 1)
+    assert cache.get(third) == (True, 3)
+
+
+def test_invalidate_only_drops_the_given_tables():
+    cache = QueryCache()
+    jobs_key = QueryCache.make_key("jobs_base_info", {"work_format": "Remote"})
+    companies_key = QueryCache.make_key("companies")
+    cache.set(jobs_key, ["job"])
+    cache.set(companies_key, ["company"])
+
+    cache.invalidate("jobs_base_info")
+
+    assert cache.get(jobs_key) == (False, None)
+    assert cache.get(companies_key) == (True, ["company"])
+
+
+def test_get_entries_caches_dimension_conditions_until_a_write(db_manager):
+    from tools.dimension_normalizer import DimensionNormalizer
+    from utils.orm_base import JobsBaseInfo
+
+    db_manager.create_tables()
+    normalizer = DimensionNormalizer(db_manager)
+
+    def add_job(url, work_format):
+        job_row = normalizer.normalize_job({
+            "platform": "LinkedIn", "title": "Engineer", "company": "ACME",
+            "location": "Brasil", "work_format": work_format, "url": url,
+        })
+        db_manager.add_entry(JobsBaseInfo(**job_row), JobsBaseInfo)
+
+    add_job("u1", "Remote")
+    first = db_manager.get_entries(JobsBaseInfo, {"work_format": "Remote"})
+    second = db_manager.get_entries(JobsBaseInfo, {"work_format": "Remote"})
+    assert second is first
+    assert db_manager.cache_stats()["hits"] == 1
+
+    add_job("u2", "Remote")
+    assert sorted(job.url for job in db_manager.get_entries(JobsBaseInfo, {"work_format": "Remote"})) == ["u1", "u2"]
+
+
+def test_managers_of_different_databases_do_not_share_reads(db_manager, tmp_path, monkeypatch):
+    from tools.database_manager import DatabaseManager
+    from utils.orm_base import Company
+
+    monkeypatch.setenv("DATABASE_CONFIG", json.dumps({"url": f"sqlite:///{tmp_path / 'other.sqlite'}"}))
+    other_manager = DatabaseManager()
+    db_manager.create_tables()
+    other_manager.create_tables()
+
+    db_manager.add_entry(Company(name="ACME", normalized_name="acme"), Company)
+    assert [company.name for company in db_manager.get_entries(Company)] == ["ACME"]
+    assert other_manager.get_entries(Company) == []
+    assert DatabaseManager().query_cache is other_manager.query_cache is not db_manager.query_cache
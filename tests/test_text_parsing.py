@@ -0,0 +1,33 @@
+from utils.text_parsing import parse_job_details, parse_location
+
+
+def test_parse_location_splits_work_format():
+    assert parse_location("São Paulo, SP (Remote)") == ("São Paulo, SP", "Remote")
+    assert parse_location("Brasil") == ("Brasil", "N/A")
+
+
+def test_parse_job_details_reads_english_insights():
+    details = parse_job_details({
+        'description': "  Build data pipelines.\n",
+        'top_card': "ACME · São Paulo, SP · 2 weeks ago · Over 1,234 applicants",
+        'insights': ["Full-time · Mid-Senior level", "5,001-10,000 employees"],
+    })
+
+    assert details == {'description': "Build data pipelines.", 'seniority': "Mid-Senior level", 'applicant_count': 1234}
+
+
+def test_parse_job_details_reads_portuguese_insights():
+    details = parse_job_details({
+        'description': "Construir pipelines de dados.",
+        'top_card': "ACME · São Paulo, SP · há 3 dias · 87 candidaturas",
+        'insights': ["Tempo integral · Pleno-sênior"],
+    })
+
+    assert details['seniority'] == "Pleno-sênior"
+    assert details['applicant_count'] == 87
+
+
+def test_parse_job_details_without_insights():
+    details = parse_job_details({'description': "Build data pipelines.", 'top_card': "ACME · São Paulo, SP"})
+
+    assert details == {'description': "Build data pipelines.", 'seniority': None, 'applicant_count': None}
@@ -0,0 +1,136 @@
+import pytest
+
+pytest.importorskip("loguru")
+exceptions = pytest.importorskip("selenium.common.exceptions")
+
+from tools import throttle_manager
+from tools.throttle_manager import RateLimitError, ThrottleController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    # The controller logger writes data/app.log relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    clock = FakeClock()
+    monkeypatch.setattr(throttle_manager.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(throttle_manager.time, "sleep", clock.sleep)
+    monkeypatch.setattr(throttle_manager.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def make_throttle(**kwargs):
+    return ThrottleController("LinkedIn", 1, **kwargs)
+
+
+def test_success_decreases_delay_down_to_the_minimum(clock):
+    throttle = make_throttle(initial_delay=1.5, min_delay=1.0, decrease_step=0.25)
+
+    throttle.record_success()
+    assert throttle.delay == 1.25
+    throttle.record_success()
+    throttle.record_success()
+    assert throttle.delay == 1.0
+
+
+def test_latency_spike_increases_delay(clock):
+    throttle = make_throttle(initial_delay=4.0, decrease_step=0.5, increase_factor=2.0, latency_spike_ratio=2.0)
+
+    throttle.record_success(latency=1.0)
+    assert throttle.delay == 3.5
+    throttle.record_success(latency=1.5)
+    assert throttle.delay == 3.0
+    throttle.record_success(latency=5.0)
+    assert throttle.delay == 6.0
+
+
+def test_failure_increases_delay_and_backs_off_with_jitter(clock):
+    throttle = make_throttle(initial_delay=3.0, max_delay=10.0, backoff_base=5.0, backoff_cap=300.0)
+
+    assert throttle.record_failure(exceptions.TimeoutException("slow page")) == ThrottleController.RETRY
+    assert throttle.delay == 6.0
+    assert throttle.record_failure(exceptions.TimeoutException("slow page")) == ThrottleController.RETRY
+    assert throttle.delay == 10.0
+    assert clock.sleeps == [10.0, 20.0]
+    assert throttle.error_counts == {"timeout": 2}
+
+
+@pytest.mark.parametrize("error, error_class", [
+    (RateLimitError("checkpoint"), "rate_limit"),
+    (exceptions.TimeoutException("slow page"), "timeout"),
+    (exceptions.InvalidSessionIdException("gone"), "driver"),
+    (exceptions.NoSuchWindowException("closed"), "driver"),
+    (ConnectionError("refused"), "driver"),
+    (exceptions.WebDriverException("chrome not reachable: disconnected"), "driver"),
+    (Exception("HTTPConnectionPool: Max retries exceeded with url"), "driver"),
+    (exceptions.WebDriverException("element click intercepted"), "other"),
+    (ValueError("bad data"), "other"),
+])
+def test_classify(error, error_class):
+    assert ThrottleController.classify(error) == error_class
+
+
+def test_driver_errors_recreate_the_driver_immediately(clock):
+    throttle = make_throttle()
+
+    assert throttle.record_failure(exceptions.InvalidSessionIdException("gone")) == ThrottleController.RECREATE_DRIVER
+    assert throttle.consecutive_failures == 0
+    assert clock.sleeps == []
+
+
+def test_circuit_opens_into_recreate_driver_at_threshold(clock):
+    throttle = make_throttle(failure_threshold=3)
+
+    actions = [throttle.record_failure(exceptions.TimeoutException("slow page")) for _ in range(3)]
+
+    assert actions == [ThrottleController.RETRY, ThrottleController.RETRY, ThrottleController.RECREATE_DRIVER]
+    assert throttle.consecutive_failures == 0
+    assert throttle.paused_until == 0.0
+
+
+def test_circuit_opens_into_pause_account_on_rate_limits(clock):
+    throttle = make_throttle(failure_threshold=2, pause_seconds=1800)
+
+    actions = [throttle.record_failure(RateLimitError("checkpoint")) for _ in range(2)]
+
+    assert actions == [ThrottleController.RETRY, ThrottleController.PAUSE_ACCOUNT]
+    assert throttle.paused_until == clock.now + 1800
+
+
+def test_success_resets_the_failure_streak(clock):
+    throttle = make_throttle(failure_threshold=2)
+
+    throttle.record_failure(exceptions.TimeoutException("slow page"))
+    throttle.record_success()
+
+    assert throttle.record_failure(exceptions.TimeoutException("slow page")) == ThrottleController.RETRY
+
+
+def test_wait_sleeps_through_pause_and_delay(clock):
+    throttle = make_throttle(initial_delay=3.0)
+
+    throttle.wait()
+    assert clock.sleeps == []
+
+    clock.now += 1.0
+    throttle.wait()
+    assert clock.sleeps == [2.0]
+
+    throttle.paused_until = clock.now + 100
+    throttle.wait()
+    assert clock.sleeps == [2.0, 100.0]
+
+    throttle.wait()
+    assert clock.sleeps == [2.0, 100.0, 3.0]